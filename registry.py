@@ -1,7 +1,7 @@
 # mcp_server.py
 """
 Lightweight MCP-style server (Model Context Protocol inspired)
-- JSON-RPC 2.0-like messages over WebSocket
+- JSON-RPC 2.0-like messages over WebSocket (binary frames preferred; replies are binary UTF-8 JSON)
 - HTTP discovery endpoint for metadata
 - Tool registration system
 - Two example tools: filesystem and calc
@@ -12,15 +12,19 @@ Notes:
 """
 
 import asyncio
+import base64
+import concurrent.futures
+import functools
 import json
 import logging
 import os
 import pathlib
 import shlex
-import traceback
+import socket
 from dataclasses import dataclass, asdict
 from typing import Any, Awaitable, Callable, Dict, Optional
 
+import orjson
 import websockets
 from websockets.server import WebSocketServerProtocol
 from aiohttp import web
@@ -33,9 +37,29 @@ logger = logging.getLogger("mcp_server")
 JSON = Dict[str, Any]
 RPCHandler = Callable[[JSON], Awaitable[JSON]]
 
+# ---- Outbound queue limits ----
+OUTBOX_MAXSIZE = 1024  # pending broadcast frames per client before dropping
+OUTBOX_BATCH_MAX = 128  # frames coalesced into a single JSON array send
+
+# ---- Socket tuning ----
+WS_SNDBUF = 1 << 20  # larger send buffer absorbs broadcast bursts
+
+# ---- Filesystem limits ----
+READ_CHUNK_MAX = 256 * 1024  # max bytes returned by a single filesystem read
+
 # ---- Utility helpers ----
-def json_dumps(payload: JSON) -> str:
-    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+_b64encode = base64.b64encode
+
+def json_dumps(payload: Any) -> bytes:
+    # orjson already emits compact UTF-8; websockets sends bytes as-is
+    try:
+        return orjson.dumps(payload)
+    except orjson.JSONEncodeError:
+        # e.g. integers beyond 64 bits, which the stdlib encoder handles
+        return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+def json_response(payload: Any) -> web.Response:
+    return web.Response(body=json_dumps(payload), content_type="application/json")
 
 def make_error(id_, code: int, message: str, data: Optional[Any] = None) -> JSON:
     err = {"jsonrpc": "2.0", "id": id_, "error": {"code": code, "message": message}}
@@ -43,8 +67,24 @@ def make_error(id_, code: int, message: str, data: Optional[Any] = None) -> JSON
         err["error"]["data"] = data
     return err
 
-def make_result(id_, result: Any) -> JSON:
-    return {"jsonrpc": "2.0", "id": id_, "result": result}
+# Response envelope pieces; frames are assembled by bytes concatenation so the
+# hot path never allocates the outer {"jsonrpc", "id", ...} dict.
+_RESP_PREFIX = b'{"jsonrpc":"2.0","id":'
+_RESULT_MID = b',"result":'
+_ERROR_MID = b',"error":'
+_END = b"}"
+
+def result_frame(id_, result_bytes: bytes) -> bytes:
+    # Splice an already-serialized result into the response envelope
+    return _RESP_PREFIX + json_dumps(id_) + _RESULT_MID + result_bytes + _END
+
+def error_frame(id_, error_bytes: bytes) -> bytes:
+    return _RESP_PREFIX + json_dumps(id_) + _ERROR_MID + error_bytes + _END
+
+# Constant error payloads, serialized once at import
+PARSE_ERROR_BYTES = json_dumps(make_error(None, -32700, "Parse error"))
+INVALID_REQUEST_ERROR = orjson.dumps({"code": -32600, "message": "Invalid Request"})
+METHOD_NOT_FOUND_ERROR = orjson.dumps({"code": -32601, "message": "Method not found"})
 
 # ---- MCP-ish server components ----
 
@@ -59,6 +99,9 @@ class ToolMeta:
 class Tool:
     def __init__(self, meta: ToolMeta):
         self.meta = meta
+        # metadata is fixed after construction; serialize it once for discovery
+        self._meta_dict = asdict(meta)
+        self._meta_bytes = json_dumps(self._meta_dict)
 
     async def call(self, params: JSON) -> JSON:
         """
@@ -70,26 +113,40 @@ class Tool:
 class ToolRegistry:
     def __init__(self):
         self._tools: Dict[str, Tool] = {}
+        # tools are registered at startup, so the listing is built once and reused
+        self._cached_list: Optional[list] = None
+        self._cached_bytes: Optional[bytes] = None
 
     def register(self, tool: Tool):
         if tool.meta.id in self._tools:
             raise KeyError(f"Tool {tool.meta.id} already registered")
         self._tools[tool.meta.id] = tool
+        self._cached_list = None
+        self._cached_bytes = None
         logger.info("Registered tool: %s", tool.meta.id)
 
     def get(self, tool_id: str) -> Optional[Tool]:
         return self._tools.get(tool_id)
 
     def list_tools(self):
-        return [asdict(t.meta) for t in self._tools.values()]
+        if self._cached_list is None:
+            self._cached_list = [t._meta_dict for t in self._tools.values()]
+        return self._cached_list
+
+    def list_tools_bytes(self) -> bytes:
+        """Serialized {"tools": [...]} result for the list_tools RPC."""
+        if self._cached_bytes is None:
+            self._cached_bytes = json_dumps({"tools": self.list_tools()})
+        return self._cached_bytes
 
 # ---- Example tool: Filesystem reader ----
 class FileSystemTool(Tool):
-    def __init__(self, base_path: str = "."):
+    def __init__(self, base_path: str = ".", executor: Optional[concurrent.futures.Executor] = None):
         meta = ToolMeta(
             id="filesystem",
             title="Filesystem Access",
-            description="List directories and read files (safe, relative to base_path).",
+            description="List directories and read files (safe, relative to base_path). "
+                        f"Reads return at most {READ_CHUNK_MAX // 1024} KiB; continue from next_offset until eof.",
             input_schema={
                 "type": "object",
                 "properties": {
@@ -104,14 +161,32 @@ class FileSystemTool(Tool):
         )
         super().__init__(meta)
         self.base = pathlib.Path(base_path).resolve()
+        # string forms for the containment check in _resolve
+        self._base_root = str(self.base)
+        self._base_str = os.path.join(self._base_root, "")
+        # None means the loop's default executor
+        self.executor = executor
 
-    def _resolve(self, relative_path: str) -> pathlib.Path:
+    def _resolve(self, relative_path: str) -> str:
         # Avoid path traversal by resolving and ensuring it's within base
-        candidate = (self.base / relative_path).resolve()
-        if self.base not in candidate.parents and candidate != self.base:
+        candidate = os.path.realpath(os.path.join(self._base_str, relative_path))
+        if candidate != self._base_root and not candidate.startswith(self._base_str):
             raise PermissionError("path outside of allowed base")
         return candidate
 
+    @staticmethod
+    def _list_sync(target: str):
+        # scandir entries carry d_type from readdir, so is_dir() needs no extra stat
+        entries = []
+        with os.scandir(target) as it:
+            for e in sorted(it, key=lambda e: e.name):
+                entries.append({
+                    "name": e.name,
+                    "is_dir": e.is_dir(),
+                    "size": e.stat().st_size,
+                })
+        return entries
+
     async def call(self, params: JSON) -> JSON:
         action = params.get("action")
         rel_path = params.get("path", ".")
@@ -121,34 +196,43 @@ class FileSystemTool(Tool):
             return {"ok": False, "error": str(e)}
 
         if action == "list":
-            if not target.exists():
+            if not os.path.exists(target):
                 return {"ok": False, "error": "not found"}
-            if not target.is_dir():
+            if not os.path.isdir(target):
                 return {"ok": False, "error": "not a directory"}
-            entries = []
-            for p in sorted(target.iterdir()):
-                entries.append({
-                    "name": p.name,
-                    "is_dir": p.is_dir(),
-                    "size": p.stat().st_size,
-                })
+            # Directory walks can be slow on large trees; keep them off the event loop
+            loop = asyncio.get_running_loop()
+            entries = await loop.run_in_executor(self.executor, self._list_sync, target)
             return {"ok": True, "entries": entries}
         elif action == "read":
-            if not target.exists() or not target.is_file():
+            if not os.path.isfile(target):
                 return {"ok": False, "error": "file not found"}
             offset = int(params.get("offset", 0))
             length = params.get("length")
-            length = int(length) if length is not None else None
+            length = int(length) if length is not None else -1
+            if length == 0:
+                # an empty page would never advance next_offset
+                return {"ok": False, "error": "length must be non-zero"}
+            # Large files are paged: clients re-issue read with next_offset until eof.
+            # A negative length (the old read-to-EOF form) reads one full page.
+            length = READ_CHUNK_MAX if length < 0 else min(length, READ_CHUNK_MAX)
             # Read safely in async-friendly way
             loop = asyncio.get_running_loop()
             def read_sync():
-                with target.open("rb") as fh:
+                with open(target, "rb") as fh:
+                    size = os.fstat(fh.fileno()).st_size
                     fh.seek(offset)
-                    return fh.read(length)
-            content = await loop.run_in_executor(None, read_sync)
+                    return fh.read(length), size
+            content, size = await loop.run_in_executor(self.executor, read_sync)
+            next_offset = offset + len(content)
             # Return base64 to be safe for binary
-            import base64
-            return {"ok": True, "content_b64": base64.b64encode(content).decode("ascii")}
+            return {
+                "ok": True,
+                "content_b64": _b64encode(content).decode("ascii"),
+                "offset": offset,
+                "next_offset": next_offset,
+                "eof": next_offset >= size,
+            }
         else:
             return {"ok": False, "error": "unknown action"}
 
@@ -168,34 +252,59 @@ SAFE_OPERATORS = {
     ast.FloorDiv: op.floordiv,
 }
 
+def _check_constant(node):
+    if not isinstance(node.value, (int, float)):
+        raise ValueError("Unsupported constant")
+    return ()
+
+def _check_binop(node):
+    if type(node.op) not in SAFE_OPERATORS:
+        raise ValueError("Operator not allowed")
+    return (node.left, node.right)
+
+def _check_unaryop(node):
+    if type(node.op) not in SAFE_OPERATORS:
+        raise ValueError("Operator not allowed")
+    return (node.operand,)
+
+# node type -> checker returning the child nodes still to visit
+_NODE_CHECKERS = {
+    ast.Constant: _check_constant,  # py3.8+
+    ast.BinOp: _check_binop,
+    ast.UnaryOp: _check_unaryop,
+}
+
+def _validate(node):
+    """
+    Reject anything but numeric constants and whitelisted arithmetic operators.
+    Raises ValueError; does not evaluate. Walks iteratively so deeply nested
+    input cannot exhaust the recursion limit.
+    """
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        checker = _NODE_CHECKERS.get(type(node))
+        if checker is None:
+            raise ValueError("Unsupported expression")
+        stack.extend(checker(node))
+
+# Longer expressions are compiled uncached so the cache cannot pin large keys
+CALC_CACHE_MAX_EXPR = 256
+
+def _compile(expr: str):
+    # Only validated trees reach compile(), so the bytecode is pure arithmetic
+    tree = ast.parse(expr, mode="eval")
+    _validate(tree.body)
+    return compile(tree, "<calc>", "eval")
+
+_compile_cached = functools.lru_cache(maxsize=1024)(_compile)
+
 def safe_eval_expr(expr: str) -> float:
     """
     Evaluate a math expression safely (supports + - * / ** % // and parentheses).
     """
-    def _eval(node):
-        if isinstance(node, ast.Num):  # type: ignore[attr-defined]
-            return node.n
-        if isinstance(node, ast.Constant):  # py3.8+
-            if isinstance(node.value, (int, float)):
-                return node.value
-            raise ValueError("Unsupported constant")
-        if isinstance(node, ast.BinOp):
-            left = _eval(node.left)
-            right = _eval(node.right)
-            op_type = type(node.op)
-            if op_type not in SAFE_OPERATORS:
-                raise ValueError("Operator not allowed")
-            return SAFE_OPERATORS[op_type](left, right)
-        if isinstance(node, ast.UnaryOp):
-            operand = _eval(node.operand)
-            op_type = type(node.op)
-            if op_type not in SAFE_OPERATORS:
-                raise ValueError("Operator not allowed")
-            return SAFE_OPERATORS[op_type](operand)
-        raise ValueError("Unsupported expression")
-
-    node = ast.parse(expr, mode="eval")
-    return _eval(node.body)
+    code = _compile_cached(expr) if len(expr) <= CALC_CACHE_MAX_EXPR else _compile(expr)
+    return eval(code, {"__builtins__": {}}, {})
 
 class CalcTool(Tool):
     def __init__(self):
@@ -229,70 +338,118 @@ class MCPServer:
     """
     def __init__(self, registry: ToolRegistry):
         self.registry = registry
-        self.active_connections = set()
+        self._outboxes: Dict[WebSocketServerProtocol, asyncio.Queue] = {}
+        # JSON-RPC method name -> coroutine(websocket, id_, params)
+        self._methods = {
+            "list_tools": self._m_list,
+            "call_tool": self._m_call,
+        }
+
+    async def _m_list(self, websocket: WebSocketServerProtocol, id_, params: JSON):
+        await websocket.send(result_frame(id_, self.registry.list_tools_bytes()))
+
+    async def _m_call(self, websocket: WebSocketServerProtocol, id_, params: JSON):
+        tool_id = params.get("tool")
+        tool_params = params.get("params", {})
+        if not tool_id:
+            await websocket.send(json_dumps(make_error(id_, -32602, "Missing tool id")))
+            return
+        tool = self.registry.get(tool_id)
+        if not tool:
+            await websocket.send(json_dumps(make_error(id_, -32601, f"Tool {tool_id} not found")))
+            return
+        # Call tool
+        try:
+            result = await tool.call(tool_params)
+            await websocket.send(result_frame(id_, json_dumps({"ok": True, "result": result})))
+        except Exception as e:
+            logger.exception("Tool call error")
+            await websocket.send(json_dumps(make_error(id_, -32000, "Tool execution error", data=str(e))))
+
+    async def _writer(self, websocket: WebSocketServerProtocol, queue: asyncio.Queue):
+        """
+        Drain a client's outbox. Frames queued while a send is in flight are
+        coalesced into one JSON array (a JSON-RPC batch) to save per-frame overhead.
+        """
+        try:
+            while True:
+                frame = await queue.get()
+                batch = [frame]
+                while not queue.empty() and len(batch) < OUTBOX_BATCH_MAX:
+                    batch.append(queue.get_nowait())
+                if len(batch) == 1:
+                    await websocket.send(frame)
+                else:
+                    await websocket.send(b"[" + b",".join(batch) + b"]")
+        except websockets.ConnectionClosed:
+            pass
+
+    @staticmethod
+    def _tune_socket(websocket: WebSocketServerProtocol):
+        sock = websocket.transport.get_extra_info("socket")
+        if sock is None:
+            return
+        try:
+            # asyncio already enables TCP_NODELAY on TCP transports
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, WS_SNDBUF)
+        except OSError as e:
+            logger.debug("Socket tuning failed: %s", e)
 
     async def handler(self, websocket: WebSocketServerProtocol, path: str):
         logger.info("Client connected: %s", websocket.remote_address)
-        self.active_connections.add(websocket)
+        self._tune_socket(websocket)
+        outbox: asyncio.Queue = asyncio.Queue(maxsize=OUTBOX_MAXSIZE)
+        self._outboxes[websocket] = outbox
+        writer_task = asyncio.create_task(self._writer(websocket, outbox))
+        # Bind hot-loop lookups to locals (LOAD_FAST instead of global/attribute loads)
+        # stdlib parse: orjson turns integers wider than 64 bits into floats,
+        # which would corrupt request ids and tool params
+        _loads = json.loads
+        _send = websocket.send
+        _get_method = self._methods.get
+        _error_frame = error_frame
+        _isinstance = isinstance
         try:
             async for raw in websocket:
+                # Binary frames arrive as bytes without websockets' UTF-8 pass;
+                # json.loads decodes (and rejects invalid) UTF-8 bytes itself.
                 try:
-                    msg = json.loads(raw)
+                    msg = _loads(raw)
                 except Exception:
-                    await websocket.send(json_dumps(make_error(None, -32700, "Parse error")))
+                    await _send(PARSE_ERROR_BYTES)
                     continue
 
                 # Basic JSON-RPC validation
-                if not isinstance(msg, dict) or "jsonrpc" not in msg:
-                    await websocket.send(json_dumps(make_error(msg.get("id"), -32600, "Invalid Request")))
+                if not _isinstance(msg, dict) or "jsonrpc" not in msg:
+                    id_ = msg.get("id") if _isinstance(msg, dict) else None
+                    await _send(_error_frame(id_, INVALID_REQUEST_ERROR))
                     continue
 
                 method = msg.get("method")
                 id_ = msg.get("id")
                 params = msg.get("params", {})
 
-                if method == "list_tools":
-                    result = {"tools": self.registry.list_tools()}
-                    await websocket.send(json_dumps(make_result(id_, result)))
+                fn = _get_method(method) if _isinstance(method, str) else None
+                if fn is None:
+                    await _send(_error_frame(id_, METHOD_NOT_FOUND_ERROR))
                     continue
-
-                if method == "call_tool":
-                    tool_id = params.get("tool")
-                    tool_params = params.get("params", {})
-                    if not tool_id:
-                        await websocket.send(json_dumps(make_error(id_, -32602, "Missing tool id")))
-                        continue
-                    tool = self.registry.get(tool_id)
-                    if not tool:
-                        await websocket.send(json_dumps(make_error(id_, -32601, f"Tool {tool_id} not found")))
-                        continue
-                    # Call tool
-                    try:
-                        result = await tool.call(tool_params)
-                        await websocket.send(json_dumps(make_result(id_, {"ok": True, "result": result})))
-                    except Exception as e:
-                        tb = traceback.format_exc()
-                        logger.exception("Tool call error")
-                        await websocket.send(json_dumps(make_error(id_, -32000, "Tool execution error", data=str(e))))
-                    continue
-
-                # unknown method
-                await websocket.send(json_dumps(make_error(id_, -32601, "Method not found")))
+                await fn(websocket, id_, params)
         except websockets.ConnectionClosedOK:
             logger.info("Connection closed (OK)")
         except Exception as e:
             logger.exception("Connection handler exception: %s", e)
         finally:
-            self.active_connections.discard(websocket)
+            self._outboxes.pop(websocket, None)
+            writer_task.cancel()
             logger.info("Client disconnected: %s", websocket.remote_address)
 
     async def broadcast(self, message: JSON):
-        text = json_dumps(message)
-        coros = []
-        for conn in list(self.active_connections):
-            coros.append(conn.send(text))
-        if coros:
-            await asyncio.gather(*coros, return_exceptions=True)
+        frame = json_dumps(message)
+        for conn, outbox in list(self._outboxes.items()):
+            try:
+                outbox.put_nowait(frame)
+            except asyncio.QueueFull:
+                logger.warning("Dropping broadcast for slow client: %s", conn.remote_address)
 
 # ---- HTTP discovery server (aiohttp) ----
 
@@ -300,7 +457,7 @@ def make_discovery_app(registry: ToolRegistry):
     app = web.Application()
 
     async def index(request):
-        return web.json_response({
+        return json_response({
             "server": "mcp-lite-python",
             "version": "0.1",
             "tools": registry.list_tools(),
@@ -312,7 +469,7 @@ def make_discovery_app(registry: ToolRegistry):
         tool = registry.get(tid)
         if not tool:
             raise web.HTTPNotFound(text="tool not found")
-        return web.json_response(asdict(tool.meta))
+        return web.Response(body=tool._meta_bytes, content_type="application/json")
 
     app.add_routes([web.get("/", index), web.get("/tools/{tool_id}", tool_meta)])
     return app
@@ -320,16 +477,28 @@ def make_discovery_app(registry: ToolRegistry):
 # ---- Bootstrap and CLI ----
 
 async def start_servers(ws_host="0.0.0.0", ws_port=8765, http_host="127.0.0.1", http_port=8080, base_path="."):
+    # Dedicated, bounded pool for blocking filesystem calls
+    io_pool = concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(32, (os.cpu_count() or 1) * 4), thread_name_prefix="fs-io"
+    )
     registry = ToolRegistry()
     # register example tools
-    registry.register(FileSystemTool(base_path=base_path))
+    registry.register(FileSystemTool(base_path=base_path, executor=io_pool))
     registry.register(CalcTool())
 
     mcp = MCPServer(registry=registry)
 
     # Start WebSocket server
     logger.info("Starting WebSocket server on %s:%d", ws_host, ws_port)
-    ws_server = await websockets.serve(mcp.handler, ws_host, ws_port, max_size=2**20)  # 1MB max message
+    # permessage-deflate costs more CPU than it saves on small JSON-RPC frames
+    ws_server = await websockets.serve(
+        mcp.handler, ws_host, ws_port,
+        max_size=2**20,  # 1MB max message
+        compression=None,
+        max_queue=16,  # frames buffered before reads apply backpressure; with max_size, <= 16 MiB per client
+        write_limit=2**20,  # outgoing buffer high-water mark before send() waits on drain
+        ping_interval=30,
+    )
 
     # Start HTTP server (aiohttp)
     discovery_app = make_discovery_app(registry)
@@ -349,6 +518,7 @@ async def start_servers(ws_host="0.0.0.0", ws_port=8765, http_host="127.0.0.1",
         ws_server.close()
         await ws_server.wait_closed()
         await runner.cleanup()
+        io_pool.shutdown(wait=False)
 
 def run_main():
     import argparse
@@ -359,6 +529,11 @@ def run_main():
     parser.add_argument("--http-port", type=int, default=8080)
     parser.add_argument("--base-path", default=".")
     args = parser.parse_args()
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass  # optional: fall back to the default asyncio loop
     try:
         asyncio.run(start_servers(
             ws_host=args.ws_host,
@@ -0,0 +1,65 @@
+"""
+Optional numba-compiled kernels for data_processor.py.
+
+numba is imported by load(), not at module import, so invocations that never
+reach a kernel do not pay for it. load() returns None when numba is missing;
+callers then fall back to NumPy.
+"""
+
+from types import SimpleNamespace
+from typing import Optional
+
+import numpy as np
+
+_kernels: Optional[SimpleNamespace] = None
+_loaded = False
+
+
+def load() -> Optional[SimpleNamespace]:
+    """Compile (or load from numba's cache) the kernels once per process."""
+    global _kernels, _loaded
+    if _loaded:
+        return _kernels
+    _loaded = True
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    @numba.njit(cache=True, fastmath=True)
+    def correlation_terms(x, y):
+        """Return (sum dx*dy, sum dx*dx, sum dy*dy) about the means, fused in two passes."""
+        n = x.size
+        sx = 0.0
+        sy = 0.0
+        for i in range(n):
+            sx += x[i]
+            sy += y[i]
+        mx = sx / n
+        my = sy / n
+        sxy = 0.0
+        sxx = 0.0
+        syy = 0.0
+        for i in range(n):
+            a = x[i] - mx
+            b = y[i] - my
+            sxy += a * b
+            sxx += a * a
+            syy += b * b
+        return sxy, sxx, syy
+
+    @numba.njit(cache=True, fastmath=True)
+    def moving_average(x, window):
+        """Sliding-window mean without temporary buffers."""
+        out = np.empty(x.size - window + 1)
+        acc = 0.0
+        for i in range(window):
+            acc += x[i]
+        out[0] = acc / window
+        for i in range(window, x.size):
+            acc += x[i] - x[i - window]
+            out[i - window + 1] = acc / window
+        return out
+
+    _kernels = SimpleNamespace(correlation_terms=correlation_terms, moving_average=moving_average)
+    return _kernels
@@ -1,19 +1,63 @@
 import json
 import sys
-from datetime import datetime
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# stdlib parse: orjson turns integers wider than 64 bits into floats, and this
+# plugin echoes the payload back unchanged
+_loads = json.loads
+
+def _dumps(obj):
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles them
+    return json.dumps(obj)
+
+_ts_second = None
+_ts_text = ""
+
+def _timestamp():
+    # Second-granularity local ISO timestamp, formatted at most once per second
+    global _ts_second, _ts_text
+    now = int(time.time())
+    if now != _ts_second:
+        _ts_second = now
+        _ts_text = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(now))
+    return _ts_text
 
 def analyze(payload):
     return {
         "analyzed": True,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _timestamp(),
         "data": payload
     }
 
+def serve_stdin():
+    # Long-lived worker: one JSON payload per stdin line, one JSON result per stdout line
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            result = analyze(_loads(line))
+        except Exception as e:
+            result = {"error": str(e)}
+        sys.stdout.write(_dumps(result) + "\n")
+        sys.stdout.flush()
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--stdin":
+        serve_stdin()
+        sys.exit(0)
     try:
-        data = json.loads(sys.argv[1]) if len(sys.argv) > 1 else {}
+        data = _loads(sys.argv[1]) if len(sys.argv) > 1 else {}
         result = analyze(data)
-        print(json.dumps(result))
+        print(_dumps(result))
     except Exception as e:
-        print(json.dumps({"error": str(e)}))
+        print(_dumps({"error": str(e)}))
         sys.exit(1)
@@ -5,16 +5,139 @@ Provides statistical analysis, data transformation, file I/O, and validation uti
 """
 
 import sys
+import os
 import json
 import math
 import statistics
 from typing import Any, Dict, List, Optional, Union, Callable
-from dataclasses import dataclass, asdict
+from collections import OrderedDict
+from dataclasses import dataclass
 from enum import Enum
+import importlib.util
+from functools import lru_cache
 import re
 from datetime import datetime, timedelta
 import hashlib
-import base64
+from binascii import a2b_base64, b2a_base64
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(text: Union[str, bytes]) -> Any:
+    """Parse a JSON payload with the stdlib (orjson turns integers beyond 64 bits into floats)."""
+    return json.loads(text)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a result to a JSON string."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles them
+    return json.dumps(obj)
+
+# Patterns used on every call, compiled once at import
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_DIGIT_RE = re.compile(r'\d+')
+_NUM_RE = re.compile(r'-?\d+\.?\d*')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_RE = re.compile(r'^https?://[^\s<>"]+$')
+
+
+_TYPE_MAP = {
+    'string': str,
+    'number': (int, float),
+    'boolean': bool,
+    'list': list,
+    'dict': dict,
+}
+
+_MISSING = object()
+
+# pivot_table aggregates as (first value -> state, (state, value) -> state)
+_PIVOT_ACCUMULATORS = {
+    'sum': (lambda v: 0 + v, lambda acc, v: acc + v),
+    'count': (lambda v: 1, lambda acc, v: acc + 1),
+    'min': (lambda v: v, lambda acc, v: v if v < acc else acc),
+    'max': (lambda v: v, lambda acc, v: v if v > acc else acc),
+    'mean': (lambda v: (0 + v, 1), lambda acc, v: (acc[0] + v, acc[1] + 1)),
+}
+
+# numba kernels only pay off once JIT/cache-load cost is amortized: a
+# long-lived --stdin worker and arrays at least this large.
+_KERNEL_MIN_SIZE = 10_000
+_worker_mode = False
+
+
+@lru_cache(maxsize=None)
+def _load_kernels():
+    """Load _kernels.py from next to this file; None if it or numba is unavailable."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_kernels.py')
+    try:
+        spec = importlib.util.spec_from_file_location('_mcp_data_kernels', path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.load()
+    except (ImportError, OSError):
+        return None
+
+
+def _kernels_for(size: int):
+    """Kernels to use for an array of this size, or None for the NumPy path."""
+    if not _worker_mode or size < _KERNEL_MIN_SIZE:
+        return None
+    return _load_kernels()
+
+
+# Below this length the pure-Python DP beats per-row NumPy calls
+_LEVENSHTEIN_VECTOR_MIN_LEN = 64
+
+_HASH_ALGORITHMS = frozenset({'md5', 'sha1', 'sha256', 'sha512'})
+
+
+@lru_cache(maxsize=256)
+def _get_pattern(pattern: str) -> "re.Pattern":
+    """Compile caller-supplied patterns once per distinct string."""
+    return re.compile(pattern)
+
+
+try:
+    from rapidfuzz.distance import Levenshtein as _Levenshtein
+    _rapidfuzz_levenshtein = _Levenshtein.distance
+except ImportError:
+    _rapidfuzz_levenshtein = None
+
+
+def _median_positions(start: int, stop: int) -> List[int]:
+    """Order-statistic positions whose mean is the median of [start, stop)."""
+    size = stop - start
+    mid = start + size // 2
+    return [mid] if size % 2 else [mid - 1, mid]
+
+
+def _five_number(arr: "np.ndarray") -> tuple:
+    """
+    (min, q1, median, q3, max) with quartiles as medians of the lower/upper
+    halves. A single np.partition (O(N)) places just the needed order
+    statistics instead of fully sorting.
+    """
+    n = arr.size
+    halves = [(0, n), (0, n // 2), ((n + 1) // 2, n)] if n > 1 else [(0, n)]
+    positions = [_median_positions(start, stop) for start, stop in halves]
+    kth = sorted({0, n - 1}.union(*positions))
+    part = np.partition(arr, kth)
+    medians = [sum(part[k].item() for k in ks) / len(ks) for ks in positions]
+    if n > 1:
+        median, q1, q3 = medians
+    else:
+        median = q1 = q3 = medians[0]
+    return part[0].item(), q1, median, q3, part[n - 1].item()
 
 
 class DataType(Enum):
@@ -40,7 +163,7 @@ class AggregateFunction(Enum):
     DISTINCT = "distinct"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationRule:
     """Data validation rule configuration."""
     field: str
@@ -49,7 +172,7 @@ class ValidationRule:
     error_message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Result container for data processing operations."""
     success: bool
@@ -59,7 +182,15 @@ class ProcessingResult:
     warnings: List[str]
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Shallow on purpose: fields are already JSON-safe and asdict's deep copy
+        # would duplicate large data payloads just before serialization.
+        return {
+            'success': self.success,
+            'data': self.data,
+            'metadata': self.metadata,
+            'errors': self.errors,
+            'warnings': self.warnings,
+        }
 
 
 class DataValidator:
@@ -77,17 +208,8 @@ class DataValidator:
     @staticmethod
     def validate_type(value: Any, expected_type: str) -> bool:
         """Validate value type."""
-        type_map = {
-            'string': str,
-            'number': (int, float),
-            'boolean': bool,
-            'list': list,
-            'dict': dict,
-        }
-        expected = type_map.get(expected_type)
-        if expected is None:
-            return False
-        return isinstance(value, expected)
+        expected = _TYPE_MAP.get(expected_type)
+        return expected is not None and isinstance(value, expected)
     
     @staticmethod
     def validate_range(value: Union[int, float], min_val: Optional[float] = None, 
@@ -107,21 +229,23 @@ class DataValidator:
         if not isinstance(value, str):
             return False
         try:
-            return bool(re.match(pattern, value))
+            return bool(_get_pattern(pattern).match(value))
         except re.error:
             return False
     
     @staticmethod
     def validate_email(email: str) -> bool:
         """Validate email format."""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return DataValidator.validate_regex(email, pattern)
+        if not isinstance(email, str):
+            return False
+        return bool(_EMAIL_RE.match(email))
     
     @staticmethod
     def validate_url(url: str) -> bool:
         """Validate URL format."""
-        pattern = r'^https?://[^\s<>"]+$'
-        return DataValidator.validate_regex(url, pattern)
+        if not isinstance(url, str):
+            return False
+        return bool(_URL_RE.match(url))
 
 
 class StatisticalAnalyzer:
@@ -133,27 +257,28 @@ class StatisticalAnalyzer:
         if not data:
             return {}
         
-        sorted_data = sorted(data)
-        n = len(data)
+        arr = np.asarray(data, dtype=np.float64)
+        n = arr.size
+        data_min, q1, median, q3, data_max = _five_number(arr)
         
         result = {
             'count': n,
-            'sum': sum(data),
-            'mean': statistics.mean(data),
-            'median': statistics.median(data),
-            'min': min(data),
-            'max': max(data),
-            'range': max(data) - min(data),
+            'sum': arr.sum().item(),
+            'mean': arr.mean().item(),
+            'median': median,
+            'min': data_min,
+            'max': data_max,
+            'range': data_max - data_min,
         }
         
         if n > 1:
-            result['variance'] = statistics.variance(data)
-            result['stddev'] = statistics.stdev(data)
+            result['variance'] = arr.var(ddof=1).item()
+            result['stddev'] = math.sqrt(result['variance'])
             result['stderr'] = result['stddev'] / math.sqrt(n)
         
-        # Quartiles
-        result['q1'] = statistics.median(sorted_data[:n//2])
-        result['q3'] = statistics.median(sorted_data[(n+1)//2:])
+        # Quartiles (median of lower/upper halves)
+        result['q1'] = q1
+        result['q3'] = q3
         result['iqr'] = result['q3'] - result['q1']
         
         # Skewness approximation (Pearson's)
@@ -168,13 +293,21 @@ class StatisticalAnalyzer:
         if len(x) != len(y) or len(x) < 2:
             return None
         
-        n = len(x)
-        mean_x = sum(x) / n
-        mean_y = sum(y) / n
-        
-        numerator = sum((x[i] - mean_x) * (y[i] - mean_y) for i in range(n))
-        denominator_x = math.sqrt(sum((xi - mean_x) ** 2 for xi in x))
-        denominator_y = math.sqrt(sum((yi - mean_y) ** 2 for yi in y))
+        # Centre first: the raw sum-of-products identity cancels catastrophically
+        # for data with a large offset. The dot products are vectorized either way.
+        dx = np.asarray(x, dtype=np.float64)
+        dy = np.asarray(y, dtype=np.float64)
+        kernels = _kernels_for(dx.size)
+        if kernels is not None:
+            numerator, sxx, syy = kernels.correlation_terms(dx, dy)
+        else:
+            dx = dx - dx.mean()
+            dy = dy - dy.mean()
+            numerator = np.dot(dx, dy).item()
+            sxx = np.dot(dx, dx).item()
+            syy = np.dot(dy, dy).item()
+        denominator_x = math.sqrt(sxx)
+        denominator_y = math.sqrt(syy)
         
         if denominator_x == 0 or denominator_y == 0:
             return None
@@ -187,11 +320,16 @@ class StatisticalAnalyzer:
         if window <= 0 or window > len(data):
             return []
         
-        result = []
-        for i in range(len(data) - window + 1):
-            window_avg = sum(data[i:i+window]) / window
-            result.append(window_avg)
-        return result
+        arr = np.asarray(data, dtype=np.float64)
+        kernels = _kernels_for(arr.size)
+        if kernels is not None:
+            return kernels.moving_average(arr, window).tolist()
+        
+        # Sliding sums from one cumulative sum: O(N) regardless of window size
+        csum = np.empty(arr.size + 1)
+        csum[0] = 0.0
+        np.cumsum(arr, out=csum[1:])
+        return ((csum[window:] - csum[:-window]) / window).tolist()
     
     @staticmethod
     def outliers_iqr(data: List[float], multiplier: float = 1.5) -> Dict[str, Any]:
@@ -199,16 +337,15 @@ class StatisticalAnalyzer:
         if len(data) < 4:
             return {'outliers': [], 'lower_bound': None, 'upper_bound': None}
         
-        sorted_data = sorted(data)
-        n = len(sorted_data)
-        q1 = statistics.median(sorted_data[:n//2])
-        q3 = statistics.median(sorted_data[(n+1)//2:])
+        arr = np.asarray(data, dtype=np.float64)
+        _, q1, _, q3, _ = _five_number(arr)
         iqr = q3 - q1
         
         lower_bound = q1 - multiplier * iqr
         upper_bound = q3 + multiplier * iqr
         
-        outliers = [x for x in data if x < lower_bound or x > upper_bound]
+        # Boolean mask keeps the outliers in input order
+        outliers = arr[(arr < lower_bound) | (arr > upper_bound)].tolist()
         
         return {
             'outliers': outliers,
@@ -231,14 +368,19 @@ class DataTransformer:
         if not data:
             return []
         
-        data_min = min(data)
-        data_max = max(data)
+        arr = np.asarray(data, dtype=np.float64)
+        data_min = arr.min()
+        data_max = arr.max()
         
         if data_min == data_max:
-            return [target_min] * len(data)
+            return [target_min] * arr.size
         
         scale = (target_max - target_min) / (data_max - data_min)
-        return [target_min + (x - data_min) * scale for x in data]
+        # In-place ufuncs reuse the freshly allocated buffer
+        out = arr - data_min
+        out *= scale
+        out += target_min
+        return out.tolist()
     
     @staticmethod
     def normalize_zscore(data: List[float]) -> List[float]:
@@ -246,24 +388,30 @@ class DataTransformer:
         if len(data) < 2:
             return data
         
-        mean = statistics.mean(data)
-        stddev = statistics.stdev(data)
+        arr = np.asarray(data, dtype=np.float64)
+        mean = arr.mean()
+        stddev = arr.std(ddof=1)
         
         if stddev == 0:
-            return [0.0] * len(data)
+            return [0.0] * arr.size
         
-        return [(x - mean) / stddev for x in data]
+        return ((arr - mean) / stddev).tolist()
     
     @staticmethod
     def apply_log_transform(data: List[float], base: float = math.e) -> List[float]:
         """Apply logarithmic transformation."""
-        result = []
-        for x in data:
-            if x <= 0:
-                result.append(None)
-            else:
-                result.append(math.log(x, base))
-        return result
+        ln_base = math.log(base)
+        if ln_base == 0:
+            raise ValueError("log base must not be 1")
+        
+        arr = np.asarray(data, dtype=np.float64)
+        positive = arr > 0
+        # Non-positive values become NaN here and None in the output
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out = np.where(positive, np.log(arr), np.nan)
+        if base != math.e:
+            out /= ln_base
+        return [v if ok else None for v, ok in zip(out.tolist(), positive.tolist())]
     
     @staticmethod
     def bin_data(data: List[float], bins: int) -> Dict[str, Any]:
@@ -271,28 +419,51 @@ class DataTransformer:
         if not data or bins <= 0:
             return {}
         
-        data_min = min(data)
-        data_max = max(data)
-        bin_width = (data_max - data_min) / bins
-        
-        bin_edges = [data_min + i * bin_width for i in range(bins + 1)]
-        bin_counts = [0] * bins
-        
-        for value in data:
-            bin_idx = min(int((value - data_min) / bin_width), bins - 1)
-            bin_counts[bin_idx] += 1
+        counts, edges = np.histogram(np.asarray(data, dtype=np.float64), bins=bins)
         
         return {
             'bins': bins,
-            'edges': bin_edges,
-            'counts': bin_counts,
-            'width': bin_width,
+            'edges': edges.tolist(),
+            'counts': counts.tolist(),
+            'width': ((edges[-1] - edges[0]) / bins).item(),
         }
     
     @staticmethod
     def pivot_table(data: List[Dict[str, Any]], index: str, columns: str, 
                    values: str, aggfunc: str = 'sum') -> Dict[str, Any]:
         """Create a pivot table from list of dictionaries."""
+        if aggfunc == 'median':
+            return DataTransformer._pivot_collect(data, index, columns, values, statistics.median)
+        
+        # Streaming aggregates: one running value per cell, no per-cell lists
+        init, step = _PIVOT_ACCUMULATORS.get(aggfunc, _PIVOT_ACCUMULATORS['sum'])
+        pivot = {}
+        
+        for row in data:
+            idx = row.get(index)
+            col = row.get(columns)
+            val = row.get(values)
+            
+            if idx is None or col is None or val is None:
+                continue
+            
+            cells = pivot.get(idx)
+            if cells is None:
+                cells = pivot[idx] = {}
+            acc = cells.get(col, _MISSING)
+            cells[col] = init(val) if acc is _MISSING else step(acc, val)
+        
+        if aggfunc == 'mean':
+            for cells in pivot.values():
+                for col, (total, count) in cells.items():
+                    cells[col] = total / count
+        
+        return pivot
+    
+    @staticmethod
+    def _pivot_collect(data: List[Dict[str, Any]], index: str, columns: str,
+                       values: str, agg_func: Callable[[List[Any]], Any]) -> Dict[str, Any]:
+        """Pivot by gathering each cell's values, for aggregates that need them all."""
         pivot = {}
         
         for row in data:
@@ -310,18 +481,6 @@ class DataTransformer:
             
             pivot[idx][col].append(val)
         
-        # Apply aggregation function
-        agg_map = {
-            'sum': sum,
-            'mean': statistics.mean,
-            'median': statistics.median,
-            'min': min,
-            'max': max,
-            'count': len,
-        }
-        
-        agg_func = agg_map.get(aggfunc, sum)
-        
         result = {}
         for idx, cols in pivot.items():
             result[idx] = {col: agg_func(vals) for col, vals in cols.items()}
@@ -341,10 +500,10 @@ class StringProcessor:
             text = text.lower()
         
         if remove_punctuation:
-            text = re.sub(r'[^\w\s]', '', text)
+            text = _PUNCT_RE.sub('', text)
         
         if remove_digits:
-            text = re.sub(r'\d+', '', text)
+            text = _DIGIT_RE.sub('', text)
         
         # Normalize whitespace
         text = ' '.join(text.split())
@@ -354,9 +513,8 @@ class StringProcessor:
     @staticmethod
     def extract_numbers(text: str) -> List[float]:
         """Extract all numeric values from text."""
-        pattern = r'-?\d+\.?\d*'
-        matches = re.findall(pattern, text)
-        return [float(m) for m in matches]
+        # findall scans in C; map(float) avoids a Python-level loop per match
+        return list(map(float, _NUM_RE.findall(text)))
     
     @staticmethod
     def tokenize(text: str, delimiter: Optional[str] = None) -> List[str]:
@@ -375,53 +533,100 @@ class StringProcessor:
     @staticmethod
     def levenshtein_distance(s1: str, s2: str) -> int:
         """Calculate Levenshtein edit distance between two strings."""
+        if _rapidfuzz_levenshtein is not None:
+            return _rapidfuzz_levenshtein(s1, s2)
+        
         if len(s1) < len(s2):
             return StringProcessor.levenshtein_distance(s2, s1)
         
         if len(s2) == 0:
             return len(s1)
         
-        previous_row = range(len(s2) + 1)
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-        
-        return previous_row[-1]
+        if len(s1) < _LEVENSHTEIN_VECTOR_MIN_LEN:
+            previous_row = range(len(s1) + 1)
+            for i, c2 in enumerate(s2):
+                current_row = [i + 1]
+                for j, c1 in enumerate(s1):
+                    insertions = previous_row[j + 1] + 1
+                    deletions = current_row[j] + 1
+                    substitutions = previous_row[j] + (c1 != c2)
+                    current_row.append(min(insertions, deletions, substitutions))
+                previous_row = current_row
+            return previous_row[-1]
+        
+        # Two-row DP over code points: the Python loop runs over the shorter
+        # string and each row is vectorized across the longer one. The
+        # left-to-right chain cur[j] = min(cur[j], cur[j-1] + 1) is a running
+        # minimum of (cur - j), so it becomes one minimum.accumulate.
+        codes1 = np.frombuffer(s1.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        offsets = np.arange(len(s1) + 1, dtype=np.int64)
+        previous_row = offsets.copy()
+        current_row = np.empty_like(previous_row)
+        for i, c2 in enumerate(np.frombuffer(s2.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)):
+            current_row[0] = i + 1
+            np.minimum(previous_row[1:] + 1, previous_row[:-1] + (codes1 != c2), out=current_row[1:])
+            current_row -= offsets
+            np.minimum.accumulate(current_row, out=current_row)
+            current_row += offsets
+            previous_row, current_row = current_row, previous_row
+        
+        return int(previous_row[-1])
 
 
 class CryptoHelper:
     """Cryptographic and encoding utilities."""
     
     @staticmethod
-    def hash_data(data: str, algorithm: str = 'sha256') -> str:
+    def hash_data(data: Union[str, bytes], algorithm: str = 'sha256') -> str:
         """Hash data using specified algorithm."""
-        algorithms = {
-            'md5': hashlib.md5,
-            'sha1': hashlib.sha1,
-            'sha256': hashlib.sha256,
-            'sha512': hashlib.sha512,
-        }
-        
-        hash_func = algorithms.get(algorithm.lower())
-        if not hash_func:
+        name = algorithm.lower()
+        if name not in _HASH_ALGORITHMS:
             raise ValueError(f"Unsupported algorithm: {algorithm}")
         
-        return hash_func(data.encode()).hexdigest()
+        buf = data if isinstance(data, (bytes, bytearray)) else data.encode('utf-8')
+        # usedforsecurity=False skips the FIPS gate and goes straight to OpenSSL
+        return hashlib.new(name, buf, usedforsecurity=False).hexdigest()
     
     @staticmethod
     def encode_base64(data: str) -> str:
         """Encode string to base64."""
-        return base64.b64encode(data.encode()).decode()
+        return b2a_base64(data.encode('utf-8'), newline=False).decode('ascii')
     
     @staticmethod
     def decode_base64(data: str) -> str:
         """Decode base64 string."""
-        return base64.b64decode(data.encode()).decode()
+        return a2b_base64(data.encode('utf-8')).decode('utf-8')
+
+
+# Memo budget in cached input elements, shared by describe and outliers; a
+# single input at or above _MEMO_MAX_LEN is never cached
+_MEMO_MAX_ELEMENTS = 1_000_000
+_MEMO_MAX_LEN = 100_000
+
+
+class _ElementBoundedLRU:
+    """LRU cache bounded by the total number of cached input elements, not entry count."""
+    
+    def __init__(self, max_elements: int):
+        self.max_elements = max_elements
+        self.elements = 0
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+    
+    def get(self, key: tuple, size: int, compute: Callable[[], Any]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry[1]
+        result = compute()
+        self._entries[key] = (size, result)
+        self.elements += size
+        while self.elements > self.max_elements:
+            _, (evicted_size, _) = self._entries.popitem(last=False)
+            self.elements -= evicted_size
+        return result
+
+
+_memo = _ElementBoundedLRU(_MEMO_MAX_ELEMENTS)
 
 
 class DataProcessor:
@@ -433,6 +638,54 @@ class DataProcessor:
         self.transformer = DataTransformer()
         self.string_processor = StringProcessor()
         self.crypto = CryptoHelper()
+        
+        # Dispatch tables: one dict lookup per call instead of if/elif chains
+        self._actions: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            'validate': self._validate_data,
+            'analyze': self._analyze_data,
+            'transform': self._transform_data,
+            'aggregate': self._aggregate_data,
+            'text': self._process_text,
+            'crypto': self._crypto_operation,
+        }
+        self._rule_checks: Dict[str, Callable[[Any, Dict[str, Any]], bool]] = {
+            'required': lambda value, params: self.validator.validate_required(value),
+            'type': lambda value, params: self.validator.validate_type(value, params.get('type', 'string')),
+            'range': lambda value, params: self.validator.validate_range(
+                value, params.get('min'), params.get('max')),
+            'regex': lambda value, params: self.validator.validate_regex(value, params.get('pattern', '')),
+            'email': lambda value, params: self.validator.validate_email(value),
+            'url': lambda value, params: self.validator.validate_url(value),
+        }
+        self._analyses: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            'describe': lambda p: self._describe(p.get('data', [])),
+            'correlation': lambda p: {
+                'correlation': self.analyzer.correlation(p.get('x', []), p.get('y', []))},
+            'moving_average': lambda p: {
+                'moving_average': self.analyzer.moving_average(p.get('data', []), p.get('window', 3))},
+            'outliers': lambda p: self._outliers(p.get('data', []), p.get('multiplier', 1.5)),
+        }
+        self._transforms: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            'normalize': lambda p: {'normalized': self.transformer.normalize_minmax(p.get('data', []))},
+            'zscore': lambda p: {'standardized': self.transformer.normalize_zscore(p.get('data', []))},
+            'log': lambda p: {'log_transformed': self.transformer.apply_log_transform(
+                p.get('data', []), p.get('base', math.e))},
+            'bin': lambda p: self.transformer.bin_data(p.get('data', []), p.get('bins', 10)),
+        }
+        self._text_operations: Dict[str, Callable[[str, Dict[str, Any]], Dict[str, Any]]] = {
+            'clean': lambda text, p: {'cleaned': self.string_processor.clean_text(text)},
+            'extract_numbers': lambda text, p: {'numbers': self.string_processor.extract_numbers(text)},
+            'tokenize': lambda text, p: {'tokens': self.string_processor.tokenize(text)},
+            'ngrams': lambda text, p: {'ngrams': self.string_processor.ngrams(
+                self.string_processor.tokenize(text), p.get('n', 2))},
+            'distance': lambda text, p: {'distance': self.string_processor.levenshtein_distance(
+                text, p.get('compare_to', ''))},
+        }
+        self._crypto_operations: Dict[str, Callable[[Any, Dict[str, Any]], Dict[str, Any]]] = {
+            'hash': lambda data, p: {'hash': self.crypto.hash_data(data, p.get('algorithm', 'sha256'))},
+            'encode': lambda data, p: {'encoded': self.crypto.encode_base64(data)},
+            'decode': lambda data, p: {'decoded': self.crypto.decode_base64(data)},
+        }
     
     def process(self, action: str, payload: Dict[str, Any]) -> ProcessingResult:
         """Process data based on action type."""
@@ -440,19 +693,8 @@ class DataProcessor:
         warnings = []
         
         try:
-            if action == 'validate':
-                result = self._validate_data(payload)
-            elif action == 'analyze':
-                result = self._analyze_data(payload)
-            elif action == 'transform':
-                result = self._transform_data(payload)
-            elif action == 'aggregate':
-                result = self._aggregate_data(payload)
-            elif action == 'text':
-                result = self._process_text(payload)
-            elif action == 'crypto':
-                result = self._crypto_operation(payload)
-            else:
+            handler = self._actions.get(action)
+            if handler is None:
                 return ProcessingResult(
                     success=False,
                     data=None,
@@ -460,11 +702,17 @@ class DataProcessor:
                     errors=[f"Unknown action: {action}"],
                     warnings=[]
                 )
+            result = handler(payload)
+            
+            # Formatting a timestamp per call is wasted work unless the caller asks for it
+            metadata = {'action': action, 'timestamp': None}
+            if payload.get('_include_timestamp', False):
+                metadata['timestamp'] = datetime.now().isoformat()
             
             return ProcessingResult(
                 success=True,
                 data=result,
-                metadata={'action': action, 'timestamp': datetime.now().isoformat()},
+                metadata=metadata,
                 errors=errors,
                 warnings=warnings
             )
@@ -478,6 +726,31 @@ class DataProcessor:
                 warnings=warnings
             )
     
+    def _describe(self, data: List[Union[int, float]]) -> Dict[str, float]:
+        """describe, memoized for repeated reference lists (worker mode)."""
+        if _worker_mode and isinstance(data, list) and len(data) < _MEMO_MAX_LEN:
+            values = tuple(data)
+            try:
+                return dict(_memo.get(('describe', values), len(values),
+                                      lambda: self.analyzer.describe(values)))
+            except TypeError:
+                pass  # unhashable elements; let describe report the error
+        return self.analyzer.describe(data)
+    
+    def _outliers(self, data: List[float], multiplier: float) -> Dict[str, Any]:
+        """outliers_iqr, memoized like _describe."""
+        if _worker_mode and isinstance(data, list) and len(data) < _MEMO_MAX_LEN:
+            values = tuple(data)
+            try:
+                result = dict(_memo.get(('outliers', values, multiplier), len(values),
+                                        lambda: self.analyzer.outliers_iqr(values, multiplier)))
+            except TypeError:
+                pass
+            else:
+                result['outliers'] = list(result['outliers'])  # don't hand out the cached list
+                return result
+        return self.analyzer.outliers_iqr(data, multiplier)
+    
     def _validate_data(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Validate data against rules."""
         data = payload.get('data', {})
@@ -489,24 +762,8 @@ class DataProcessor:
         for rule_dict in rules:
             rule = ValidationRule(**rule_dict)
             field_value = data.get(rule.field)
-            valid = False
-            
-            if rule.rule_type == 'required':
-                valid = self.validator.validate_required(field_value)
-            elif rule.rule_type == 'type':
-                valid = self.validator.validate_type(field_value, rule.params.get('type', 'string'))
-            elif rule.rule_type == 'range':
-                valid = self.validator.validate_range(
-                    field_value,
-                    rule.params.get('min'),
-                    rule.params.get('max')
-                )
-            elif rule.rule_type == 'regex':
-                valid = self.validator.validate_regex(field_value, rule.params.get('pattern', ''))
-            elif rule.rule_type == 'email':
-                valid = self.validator.validate_email(field_value)
-            elif rule.rule_type == 'url':
-                valid = self.validator.validate_url(field_value)
+            check = self._rule_checks.get(rule.rule_type)
+            valid = check(field_value, rule.params) if check is not None else False
             
             validation_results.append({
                 'field': rule.field,
@@ -524,40 +781,19 @@ class DataProcessor:
     
     def _analyze_data(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Perform statistical analysis."""
-        data = payload.get('data', [])
         analysis_type = payload.get('type', 'describe')
-        
-        if analysis_type == 'describe':
-            return self.analyzer.describe(data)
-        elif analysis_type == 'correlation':
-            x = payload.get('x', [])
-            y = payload.get('y', [])
-            return {'correlation': self.analyzer.correlation(x, y)}
-        elif analysis_type == 'moving_average':
-            window = payload.get('window', 3)
-            return {'moving_average': self.analyzer.moving_average(data, window)}
-        elif analysis_type == 'outliers':
-            return self.analyzer.outliers_iqr(data, payload.get('multiplier', 1.5))
-        else:
+        handler = self._analyses.get(analysis_type)
+        if handler is None:
             return {'error': f'Unknown analysis type: {analysis_type}'}
+        return handler(payload)
     
     def _transform_data(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Transform data."""
-        data = payload.get('data', [])
         transform_type = payload.get('type', 'normalize')
-        
-        if transform_type == 'normalize':
-            return {'normalized': self.transformer.normalize_minmax(data)}
-        elif transform_type == 'zscore':
-            return {'standardized': self.transformer.normalize_zscore(data)}
-        elif transform_type == 'log':
-            base = payload.get('base', math.e)
-            return {'log_transformed': self.transformer.apply_log_transform(data, base)}
-        elif transform_type == 'bin':
-            bins = payload.get('bins', 10)
-            return self.transformer.bin_data(data, bins)
-        else:
+        handler = self._transforms.get(transform_type)
+        if handler is None:
             return {'error': f'Unknown transform type: {transform_type}'}
+        return handler(payload)
     
     def _aggregate_data(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Aggregate data."""
@@ -573,66 +809,72 @@ class DataProcessor:
             return self.transformer.pivot_table(data, index, columns, values, aggfunc)
         else:
             # Simple aggregation
-            return self.analyzer.describe(data)
+            return self._describe(data)
     
     def _process_text(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Process text data."""
         text = payload.get('text', '')
         operation = payload.get('operation', 'clean')
-        
-        if operation == 'clean':
-            return {'cleaned': self.string_processor.clean_text(text)}
-        elif operation == 'extract_numbers':
-            return {'numbers': self.string_processor.extract_numbers(text)}
-        elif operation == 'tokenize':
-            return {'tokens': self.string_processor.tokenize(text)}
-        elif operation == 'ngrams':
-            tokens = self.string_processor.tokenize(text)
-            n = payload.get('n', 2)
-            return {'ngrams': self.string_processor.ngrams(tokens, n)}
-        elif operation == 'distance':
-            s2 = payload.get('compare_to', '')
-            return {'distance': self.string_processor.levenshtein_distance(text, s2)}
-        else:
+        handler = self._text_operations.get(operation)
+        if handler is None:
             return {'error': f'Unknown text operation: {operation}'}
+        return handler(text, payload)
     
     def _crypto_operation(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Perform cryptographic operations."""
         data = payload.get('data', '')
         operation = payload.get('operation', 'hash')
-        
-        if operation == 'hash':
-            algorithm = payload.get('algorithm', 'sha256')
-            return {'hash': self.crypto.hash_data(data, algorithm)}
-        elif operation == 'encode':
-            return {'encoded': self.crypto.encode_base64(data)}
-        elif operation == 'decode':
-            return {'decoded': self.crypto.decode_base64(data)}
-        else:
+        handler = self._crypto_operations.get(operation)
+        if handler is None:
             return {'error': f'Unknown crypto operation: {operation}'}
+        return handler(data, payload)
+
+
+def serve_stdin() -> None:
+    """Process one JSON payload per stdin line until EOF, one JSON result per line."""
+    global _worker_mode
+    _worker_mode = True
+    processor = DataProcessor()
+    write = sys.stdout.write
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            payload = _loads(line)
+            result = processor.process(payload.get('action', 'analyze'), payload).to_dict()
+        except json.JSONDecodeError as e:
+            result = {'error': f'Invalid JSON: {str(e)}'}
+        except Exception as e:
+            result = {'error': f'Processing failed: {str(e)}'}
+        write(_dumps(result) + '\n')
+        sys.stdout.flush()
 
 
 def main():
     """Main entry point for the plugin."""
+    if len(sys.argv) > 1 and sys.argv[1] == '--stdin':
+        serve_stdin()
+        sys.exit(0)
+    
     if len(sys.argv) < 2:
-        print(json.dumps({'error': 'No payload provided'}))
+        print(_dumps({'error': 'No payload provided'}))
         sys.exit(1)
     
     try:
-        payload = json.loads(sys.argv[1])
+        payload = _loads(sys.argv[1])
         action = payload.get('action', 'analyze')
         
         processor = DataProcessor()
         result = processor.process(action, payload)
         
-        print(json.dumps(result.to_dict()))
+        print(_dumps(result.to_dict()))
         sys.exit(0)
     
     except json.JSONDecodeError as e:
-        print(json.dumps({'error': f'Invalid JSON: {str(e)}'}))
+        print(_dumps({'error': f'Invalid JSON: {str(e)}'}))
         sys.exit(1)
     except Exception as e:
-        print(json.dumps({'error': f'Processing failed: {str(e)}'}))
+        print(_dumps({'error': f'Processing failed: {str(e)}'}))
         sys.exit(1)
 
 